@@ -8,6 +8,8 @@ class ListingAdmin(admin.ModelAdmin):
     search_fields = ('title', 'description', 'address', 'city', 'country')
     readonly_fields = ('created_at', 'updated_at')
     filter_horizontal = ()
+    # Join the owner FK shown in list_display instead of one SELECT per row
+    list_select_related = ('owner',)
     fieldsets = (
         ('Basic Information', {
             'fields': ('title', 'description', 'property_type')
@@ -33,6 +35,10 @@ class BookingAdmin(admin.ModelAdmin):
     list_filter = ('status', 'check_in', 'check_out')
     search_fields = ('listing__title', 'guest__username', 'guest__email')
     readonly_fields = ('created_at', 'updated_at')
+    # Join the FKs shown in list_display instead of one SELECT per row
+    list_select_related = ('listing', 'guest')
+    # Avoid rendering a <select> of every listing/user on the change form
+    raw_id_fields = ('listing', 'guest')
     
     def get_readonly_fields(self, request, obj=None):
         if obj:  # Editing an existing object
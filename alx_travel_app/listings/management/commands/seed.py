@@ -1,10 +1,13 @@
 import os
 import random
 from datetime import datetime, timedelta
+
+import numpy as np
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.utils import timezone
-from django.db import transaction
+from django.db import connection, transaction
 from faker import Faker
 
 # Import your models here
@@ -55,19 +58,32 @@ class Command(BaseCommand):
         
         # Create sample data
         self.faker = Faker()
-        
-        # Create users
-        users = self.create_users(options['users'])
-        
-        # Create listings
-        listings = self.create_listings(options['listings'], users)
-        
-        # Create bookings
-        bookings = self.create_bookings(options['bookings'], users, listings)
-        
-        # Create reviews
-        self.create_reviews(options['reviews'], users, bookings)
-        
+
+        # Faker text generation is comparatively slow, so build fixed pools
+        # once and sample from them instead of generating fresh text per row
+        self._paragraph_pools = {
+            n: [self.faker.paragraph(nb_sentences=n) for _ in range(200)]
+            for n in (2, 3, 5)
+        }
+        self._word_pool = [self.faker.word().title() for _ in range(500)]
+        self._sentence_pool = [self.faker.sentence() for _ in range(200)]
+        self._street_pool = [self.faker.street_name() for _ in range(200)]
+
+        # One transaction for the whole run: a single COMMIT (and fsync)
+        # at the end instead of one per batch
+        with transaction.atomic():
+            # Create users
+            users = self.create_users(options['users'])
+
+            # Create listings
+            listings = self.create_listings(options['listings'], users)
+
+            # Create bookings
+            bookings = self.create_bookings(options['bookings'], users, listings)
+
+            # Create reviews
+            self.create_reviews(options['reviews'], users, bookings)
+
         self.stdout.write(
             self.style.SUCCESS('Successfully seeded the database with sample data')
         )
@@ -75,48 +91,88 @@ class Command(BaseCommand):
     def clear_data(self):
         """Clear existing data from the database."""
         self.stdout.write('Clearing existing data...')
-        
-        # Clear data in reverse order of foreign key dependencies
-        Review.objects.all().delete()
-        Booking.objects.all().delete()
-        Listing.objects.all().delete()
-        
-        # Don't delete superusers
+
+        # TRUNCATE is a metadata operation: it skips the per-row deletes and
+        # signal dispatch that Model.objects.all().delete() performs
+        quote = connection.ops.quote_name
+        # The M2M through table must be listed explicitly: Postgres picks
+        # it up via CASCADE, but the MySQL branch truncates each table by
+        # name and would otherwise leave dangling favorite rows behind.
+        tables = [
+            Review._meta.db_table,
+            Booking._meta.db_table,
+            Listing.favorited_by.through._meta.db_table,
+            Listing._meta.db_table,
+        ]
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'TRUNCATE TABLE {} RESTART IDENTITY CASCADE'.format(
+                        ', '.join(quote(table) for table in tables)
+                    )
+                )
+        elif connection.vendor == 'mysql':
+            with connection.cursor() as cursor:
+                # MySQL truncates one table at a time and refuses while FK
+                # checks are on, even though the tables empty together
+                cursor.execute('SET FOREIGN_KEY_CHECKS = 0')
+                for table in tables:
+                    cursor.execute('TRUNCATE TABLE {}'.format(quote(table)))
+                cursor.execute('SET FOREIGN_KEY_CHECKS = 1')
+        else:
+            # Engines without a fast TRUNCATE path (e.g. SQLite in dev):
+            # clear data in reverse order of foreign key dependencies
+            Review.objects.all().delete()
+            Booking.objects.all().delete()
+            Listing.objects.all().delete()
+
+        # Don't delete superusers (cascades outside the listings tables)
         User.objects.filter(is_superuser=False).delete()
-        
+
         self.stdout.write(self.style.SUCCESS('Successfully cleared existing data'))
     
     def create_users(self, count):
         """Create sample users."""
         self.stdout.write(f'Creating {count} sample users...')
-        
-        users = []
-        for i in range(count):
-            username = f'user{i+1}'
-            email = f'{username}@example.com'
-            
-            # Skip if user already exists
-            if User.objects.filter(username=username).exists():
-                user = User.objects.get(username=username)
-                users.append(user)
-                continue
-            
-            user = User.objects.create_user(
+
+        # All sample users share the same password, so hash it once instead
+        # of paying the (deliberately slow) hasher cost per user
+        hashed_password = make_password('password123')
+
+        usernames = [f'user{i+1}' for i in range(count)]
+
+        # One query resolving all existing users instead of one per iteration
+        existing = User.objects.in_bulk(usernames, field_name='username')
+
+        new_users = [
+            User(
                 username=username,
-                email=email,
-                password='password123',
+                email=f'{username}@example.com',
+                password=hashed_password,
                 first_name=self.faker.first_name(),
                 last_name=self.faker.last_name(),
             )
-            users.append(user)
-            
-            # Create a superuser if this is the first user
-            if i == 0 and not User.objects.filter(is_superuser=True).exists():
-                user.is_staff = True
-                user.is_superuser = True
-                user.save()
-                self.stdout.write(self.style.SUCCESS(f'Created superuser: {user.username}'))
-        
+            for username in usernames if username not in existing
+        ]
+
+        created = User.objects.bulk_create(new_users, batch_size=500)
+
+        # Re-fetch the new rows on backends that don't return PKs from bulk inserts
+        if created and created[0].pk is None:
+            created = list(User.objects.filter(username__in=[u.username for u in created]))
+
+        created_by_username = {user.username: user for user in created}
+        users = [
+            existing.get(username) or created_by_username[username]
+            for username in usernames
+        ]
+
+        # Promote the first user to superuser if there isn't one yet
+        if usernames and not User.objects.filter(is_superuser=True).exists():
+            User.objects.filter(username=usernames[0]).update(is_staff=True, is_superuser=True)
+            self.stdout.write(self.style.SUCCESS(f'Created superuser: {usernames[0]}'))
+
         self.stdout.write(self.style.SUCCESS(f'Successfully created {len(users)} users'))
         return users
     
@@ -139,43 +195,53 @@ class Command(BaseCommand):
             'Pets allowed', 'Smoking allowed', 'Wheelchair accessible'
         ]
         
+        # Draw all the numeric randomness up front as vectors — one C-level
+        # call per column instead of several interpreter round-trips per row
+        rng = np.random.default_rng()
+        city_idx = rng.integers(0, len(cities), count)
+        owner_idx = rng.integers(0, len(owners), count)
+        ptype_idx = rng.integers(0, len(property_types), count)
+        latitudes = np.round(rng.uniform(-90, 90, count), 6)
+        longitudes = np.round(rng.uniform(-180, 180, count), 6)
+        prices = np.round(rng.uniform(50, 500, count), 2)
+        street_numbers = rng.integers(1, 1000, count)
+        bedrooms = rng.integers(1, 6, count)
+        bathrooms = np.round(rng.uniform(1, 4.5, count) * 2) / 2  # 1, 1.5, 2, ...
+        max_guests = rng.integers(1, 11, count)
+        amenity_counts = rng.integers(3, min(8, len(amenities_list)) + 1, count)
+
         listings = []
         for i in range(count):
-            city, country = random.choice(cities)
-            owner = random.choice(owners)
-            
-            # Generate random coordinates within the city's general area
-            latitude = random.uniform(-90, 90)
-            longitude = random.uniform(-180, 180)
-            
+            city, country = cities[city_idx[i]]
+            owner = owners[owner_idx[i]]
+
             # Generate random amenities (3-8 random amenities per listing)
-            amenities = random.sample(
-                amenities_list,
-                k=random.randint(3, min(8, len(amenities_list)))
-            )
+            amenities = random.sample(amenities_list, k=int(amenity_counts[i]))
             
-            # Determine property features based on amenities
-            has_wifi = 'WiFi' in amenities
-            has_parking = 'Free parking' in amenities
-            has_kitchen = 'Kitchen' in amenities
-            has_air_conditioning = 'Air conditioning' in amenities
-            has_heating = 'Heating' in amenities
-            has_tv = 'TV' in amenities
-            has_washer = 'Washer' in amenities
-            has_pool = 'Pool' in amenities
-            pet_friendly = 'Pets allowed' in amenities
+            # Determine property features based on amenities; membership tests
+            # go against a set rather than re-scanning the list nine times
+            amenities_set = set(amenities)
+            has_wifi = 'WiFi' in amenities_set
+            has_parking = 'Free parking' in amenities_set
+            has_kitchen = 'Kitchen' in amenities_set
+            has_air_conditioning = 'Air conditioning' in amenities_set
+            has_heating = 'Heating' in amenities_set
+            has_tv = 'TV' in amenities_set
+            has_washer = 'Washer' in amenities_set
+            has_pool = 'Pool' in amenities_set
+            pet_friendly = 'Pets allowed' in amenities_set
             
-            listing = Listing.objects.create(
-                title=f"{self.faker.word().title()} {random.choice(['House', 'Apartment', 'Villa', 'Cabin', 'Loft'])} in {city}",
-                description=self.faker.paragraph(nb_sentences=5),
-                address=f"{random.randint(1, 999)} {self.faker.street_name()}",
+            listing = Listing(
+                title=f"{random.choice(self._word_pool)} {random.choice(['House', 'Apartment', 'Villa', 'Cabin', 'Loft'])} in {city}",
+                description=random.choice(self._paragraph_pools[5]),
+                address=f"{street_numbers[i]} {random.choice(self._street_pool)}",
                 city=city,
                 country=country,
-                price_per_night=round(random.uniform(50, 500), 2),
-                bedrooms=random.randint(1, 5),
-                bathrooms=round(random.uniform(1, 4.5) * 2) / 2,  # 1, 1.5, 2, 2.5, etc.
-                max_guests=random.randint(1, 10),
-                property_type=random.choice(property_types),
+                price_per_night=float(prices[i]),
+                bedrooms=int(bedrooms[i]),
+                bathrooms=float(bathrooms[i]),
+                max_guests=int(max_guests[i]),
+                property_type=property_types[ptype_idx[i]],
                 amenities=amenities,
                 owner=owner,
                 has_wifi=has_wifi,
@@ -187,16 +253,24 @@ class Command(BaseCommand):
                 has_washer=has_washer,
                 has_pool=has_pool,
                 pet_friendly=pet_friendly,
-                latitude=latitude,
-                longitude=longitude,
+                latitude=float(latitudes[i]),
+                longitude=float(longitudes[i]),
             )
             
             listings.append(listing)
-            
+
             # Add a thumbnail image (placeholder)
             # In a real app, you would save actual image files here
             # listing.thumbnail.save(f'listing_{listing.id}.jpg', ContentFile(b''), save=True)
-        
+
+        # Insert everything in batches instead of one INSERT per listing
+        listings = Listing.objects.bulk_create(listings, batch_size=1000)
+
+        # Some backends (e.g. MySQL) don't return PKs from bulk inserts, so
+        # re-fetch the rows for the downstream booking/review creation
+        if listings and listings[0].pk is None:
+            listings = list(Listing.objects.order_by('-pk')[:len(listings)])
+
         self.stdout.write(self.style.SUCCESS(f'Successfully created {len(listings)} listings'))
         return listings
     
@@ -210,41 +284,63 @@ class Command(BaseCommand):
         
         bookings = []
         status_choices = ['PENDING', 'CONFIRMED', 'COMPLETED', 'CANCELLED']
-        
-        for _ in range(count):
-            listing = random.choice(listings)
-            guest = random.choice(users)
-            
-            # Generate random check-in date (between 60 days ago and 60 days in the future)
-            check_in = timezone.now().date() + timedelta(days=random.randint(-60, 60))
-            
-            # Generate check-out date (1-14 days after check-in)
-            check_out = check_in + timedelta(days=random.randint(1, 14))
-            
-            # Skip if check-in is in the past and status is PENDING
-            status = random.choices(
-                status_choices,
-                weights=[0.2, 0.5, 0.2, 0.1],  # Higher probability for CONFIRMED
-                k=1
-            )[0]
-            
-            if check_in < timezone.now().date() and status == 'PENDING':
+        today = timezone.now().date()
+
+        # Pre-draw all the per-booking randomness as vectors
+        rng = np.random.default_rng()
+        listing_idx = rng.integers(0, len(listings), count)
+        guest_idx = rng.integers(0, len(users), count)
+        check_in_offsets = rng.integers(-60, 61, count)
+        nights_arr = rng.integers(1, 15, count)
+        # Higher probability for CONFIRMED
+        statuses = rng.choice(status_choices, count, p=[0.2, 0.5, 0.2, 0.1])
+        special_draws = rng.random(count)
+        cancelled_days = rng.integers(1, 31, count)
+
+        # Struct-of-arrays view of the chosen listings: guest counts and
+        # prices come from array indexing instead of per-row model attribute
+        # lookups (rng.integers broadcasts over the per-listing upper bound)
+        max_guests_arr = np.array([listing.max_guests for listing in listings])
+        price_arr = np.array([float(listing.price_per_night) for listing in listings])
+        guests_arr = rng.integers(1, max_guests_arr[listing_idx] + 1)
+        total_prices = np.round(price_arr[listing_idx] * nights_arr, 2)
+
+        for i in range(count):
+            listing = listings[listing_idx[i]]
+            guest = users[guest_idx[i]]
+
+            # Check-in between 60 days ago and 60 days in the future,
+            # check-out 1-14 days after check-in
+            check_in = today + timedelta(days=int(check_in_offsets[i]))
+            nights = int(nights_arr[i])
+            check_out = check_in + timedelta(days=nights)
+
+            status = str(statuses[i])
+            if check_in < today and status == 'PENDING':
                 status = 'CANCELLED'  # Auto-cancel past pending bookings
-            
-            # Generate random number of guests (1 to max_guests for the listing)
-            guests = random.randint(1, listing.max_guests)
-            
-            # Calculate total price
-            nights = (check_out - check_in).days
-            total_price = listing.price_per_night * nights
-            
+
+            # Number of guests (1 to max_guests) and total price were drawn
+            # against the SoA arrays above
+            guests = int(guests_arr[i])
+            total_price = float(total_prices[i])
+
             # Add some random special requests (30% chance)
             special_requests = None
-            if random.random() < 0.3:
-                special_requests = self.faker.sentence()
-            
-            # Create the booking
-            booking = Booking.objects.create(
+            if special_draws[i] < 0.3:
+                special_requests = random.choice(self._sentence_pool)
+
+            # If status is CANCELLED, compute the cancellation details up front
+            # so the row is inserted with its final values (no second UPDATE)
+            cancelled_at = None
+            cancellation_reason = None
+            if status == 'CANCELLED':
+                cancelled_at = timezone.now() - timedelta(days=int(cancelled_days[i]))
+                cancellation_reason = random.choice([
+                    'Change of plans', 'Found a better deal', 'Unexpected circumstances',
+                    'Travel restrictions', 'Personal reasons'
+                ])
+
+            booking = Booking(
                 listing=listing,
                 guest=guest,
                 check_in=check_in,
@@ -253,19 +349,14 @@ class Command(BaseCommand):
                 total_price=total_price,
                 status=status,
                 special_requests=special_requests,
+                cancelled_at=cancelled_at,
+                cancellation_reason=cancellation_reason,
             )
-            
-            # If status is CANCELLED, set cancelled_at to a random time between creation and now
-            if status == 'CANCELLED':
-                booking.cancelled_at = timezone.now() - timedelta(days=random.randint(1, 30))
-                booking.cancellation_reason = random.choice([
-                    'Change of plans', 'Found a better deal', 'Unexpected circumstances',
-                    'Travel restrictions', 'Personal reasons'
-                ])
-                booking.save()
-            
+
             bookings.append(booking)
-        
+
+        bookings = Booking.objects.bulk_create(bookings, batch_size=1000)
+
         self.stdout.write(self.style.SUCCESS(f'Successfully created {len(bookings)} bookings'))
         return bookings
     
@@ -292,79 +383,106 @@ class Command(BaseCommand):
         # Randomly select bookings to review (without replacement)
         selected_bookings = random.sample(completed_bookings, count)
         
-        for booking in selected_bookings:
-            # Skip if this booking already has a review
-            if hasattr(booking, 'review'):
+        # One query for the (listing, user) pairs that already have a review,
+        # instead of probing the database per booking inside the loop
+        seen_pairs = set(
+            Review.objects.filter(
+                listing_id__in={b.listing_id for b in completed_bookings}
+            ).values_list('listing_id', 'user_id')
+        )
+
+        # Pre-draw the per-review randomness as vectors
+        rng = np.random.default_rng()
+        # Higher probability for 4-5 star ratings
+        ratings = rng.choice([1, 2, 3, 4, 5], count, p=[0.05, 0.1, 0.2, 0.3, 0.35])
+        stay_draws = rng.random(count)
+        public_draws = rng.random(count)
+        response_draws = rng.random(count)
+        response_days = rng.integers(1, 8, count)
+
+        for i, booking in enumerate(selected_bookings):
+            # Reviews are unique per (listing, user) — skip pairs that are
+            # already reviewed or queued so the batched insert below can't
+            # violate the constraint
+            pair = (booking.listing_id, booking.guest_id)
+            if pair in seen_pairs:
                 continue
-            
-            # Generate a random rating (1-5)
-            rating = random.choices(
-                [1, 2, 3, 4, 5],
-                weights=[0.05, 0.1, 0.2, 0.3, 0.35],  # Higher probability for 4-5 star ratings
-                k=1
-            )[0]
-            
+            seen_pairs.add(pair)
+
+            rating = int(ratings[i])
+
             # Generate review content based on rating
             if rating == 5:
                 title = random.choice([
                     'Amazing stay!', 'Perfect in every way', 'Highly recommended',
                     'Will definitely come back', 'Absolutely wonderful'
                 ])
-                comment = self.faker.paragraph(nb_sentences=3)
+                comment = random.choice(self._paragraph_pools[3])
             elif rating == 4:
                 title = random.choice([
                     'Great place', 'Very nice stay', 'Enjoyed our time here',
                     'Comfortable and clean', 'Good experience overall'
                 ])
-                comment = self.faker.paragraph(nb_sentences=2)
+                comment = random.choice(self._paragraph_pools[2])
             elif rating == 3:
                 title = random.choice([
                     'Decent place', 'Average experience', 'It was okay',
                     'Met expectations', 'Nothing special'
                 ])
-                comment = self.faker.paragraph(nb_sentences=2)
+                comment = random.choice(self._paragraph_pools[2])
             elif rating == 2:
                 title = random.choice([
                     'Disappointing', 'Could be better', 'Not what I expected',
                     'Several issues', 'Below average'
                 ])
-                comment = self.faker.paragraph(nb_sentences=2)
+                comment = random.choice(self._paragraph_pools[2])
             else:  # rating == 1
                 title = random.choice([
                     'Terrible experience', 'Would not recommend', 'Very disappointing',
                     'Worst stay ever', 'Never again'
                 ])
-                comment = self.faker.paragraph(nb_sentences=3)
+                comment = random.choice(self._paragraph_pools[3])
             
             # Generate a random stay date (between check-in and check-out)
-            stay_date = booking.check_in + timedelta(
-                days=random.randint(0, (booking.check_out - booking.check_in).days - 1)
-            )
-            
-            # Create the review
-            review = Review.objects.create(
+            nights = (booking.check_out - booking.check_in).days
+            stay_date = booking.check_in + timedelta(days=int(stay_draws[i] * nights))
+
+            # 20% chance of owner response, computed up front so the review is
+            # inserted with its final values (no second UPDATE per review)
+            owner_response = None
+            response_date = None
+            if response_draws[i] < 0.2:
+                owner_response = random.choice([
+                    'Thank you for your feedback!',
+                    'We appreciate your review and hope to host you again!',
+                    'Thanks for staying with us!',
+                    'We\'re glad you enjoyed your stay!',
+                    'We appreciate your honest feedback.'
+                ])
+                # created_at is set by auto_now_add at INSERT time, so
+                # approximate the response date relative to now
+                response_date = timezone.now() + timedelta(days=int(response_days[i]))
+
+            review = Review(
                 listing=booking.listing,
                 user=booking.guest,
                 rating=rating,
                 title=title,
                 comment=comment,
                 stay_date=stay_date,
-                is_public=random.choices([True, False], weights=[0.9, 0.1], k=1)[0],
+                is_public=bool(public_draws[i] < 0.9),
+                owner_response=owner_response,
+                response_date=response_date,
             )
-            
-            # 20% chance of owner response
-            if random.random() < 0.2:
-                review.owner_response = random.choice([
-                    'Thank you for your feedback!',
-                    'We appreciate your review and hope to host you again!',
-                    'Thanks for staying with us!',
-                    'We\'re glad you enjoyed your stay!',
-                    'We appreciate your honest feedback.'
-                ])
-                review.response_date = review.created_at + timedelta(days=random.randint(1, 7))
-                review.save()
-            
+
             reviews.append(review)
-        
+
+        reviews = Review.objects.bulk_create(reviews, batch_size=1000)
+
+        # bulk_create bypasses Review.save(), so refresh the denormalized
+        # rating fields for the listings that received reviews — one
+        # correlated UPDATE for the whole batch
+        Listing.bulk_update_ratings({review.listing_id for review in reviews})
+
         self.stdout.write(self.style.SUCCESS(f'Successfully created {len(reviews)} reviews'))
         return reviews
@@ -0,0 +1,277 @@
+# Generated by Django 5.2.17 on 2026-08-28 05:34
+
+import django.core.validators
+import django.db.models.deletion
+import listings.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.PositiveSmallIntegerField(choices=[(1, '1 - Poor'), (2, '2 - Fair'), (3, '3 - Good'), (4, '4 - Very Good'), (5, '5 - Excellent')], help_text='Rating from 1 (poor) to 5 (excellent)', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('title', models.CharField(help_text='A short title for the review', max_length=200)),
+                ('comment', models.TextField(help_text='Detailed review comments')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('stay_date', models.DateField(blank=True, help_text='When the user stayed at the property', null=True)),
+                ('is_public', models.BooleanField(default=True, help_text='Whether the review is visible to others')),
+                ('owner_response', models.TextField(blank=True, help_text='Response from the property owner', null=True)),
+                ('response_date', models.DateTimeField(blank=True, help_text='When the owner responded to the review', null=True)),
+            ],
+            options={
+                'verbose_name': 'Review',
+                'verbose_name_plural': 'Reviews',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='cancellation_reason',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='cancelled_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='guests',
+            field=models.PositiveIntegerField(default=1, help_text='Number of guests', validators=[django.core.validators.MinValueValidator(1)]),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='special_requests',
+            field=models.TextField(blank=True, help_text='Any special requests from the guest', null=True),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='average_rating',
+            field=models.DecimalField(decimal_places=2, default=0.0, editable=False, help_text='Average rating from all reviews (1-5)', max_digits=3),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='has_air_conditioning',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='has_heating',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='has_kitchen',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='has_parking',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='has_pool',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='has_tv',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='has_washer',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='has_wifi',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='latitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Geographic latitude', max_digits=9, null=True),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='longitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Geographic longitude', max_digits=9, null=True),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='pet_friendly',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Total number of reviews for this listing'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='check_in',
+            field=models.DateField(help_text='Check-in date', validators=[listings.models.validate_future_date]),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='check_out',
+            field=models.DateField(help_text='Check-out date', validators=[listings.models.validate_future_date]),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='guest',
+            field=models.ForeignKey(help_text='User who made the booking', on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='listing',
+            field=models.ForeignKey(help_text='The property being booked', on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to='listings.listing'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('CONFIRMED', 'Confirmed'), ('CANCELLED', 'Cancelled'), ('COMPLETED', 'Completed'), ('NO_SHOW', 'No Show')], default='PENDING', help_text='Current status of the booking', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='total_price',
+            field=models.DecimalField(decimal_places=2, help_text='Total price for the booking', max_digits=10, validators=[django.core.validators.MinValueValidator(0.01)]),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='address',
+            field=models.CharField(help_text='Full street address', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='amenities',
+            field=models.JSONField(blank=True, default=list, help_text="List of amenities available (e.g., ['WiFi', 'Pool', 'Kitchen'])"),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='bathrooms',
+            field=models.DecimalField(decimal_places=1, help_text='Number of bathrooms (can be half bathrooms)', max_digits=3, validators=[django.core.validators.MinValueValidator(0.5)]),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='bedrooms',
+            field=models.PositiveIntegerField(help_text='Number of bedrooms'),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='city',
+            field=models.CharField(help_text='City where the property is located', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='country',
+            field=models.CharField(help_text='Country where the property is located', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='description',
+            field=models.TextField(help_text='Detailed description of the property'),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='is_available',
+            field=models.BooleanField(default=True, help_text='Whether the property is available for booking'),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='max_guests',
+            field=models.PositiveIntegerField(help_text='Maximum number of guests allowed', validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='owner',
+            field=models.ForeignKey(help_text='User who owns this listing', on_delete=django.db.models.deletion.CASCADE, related_name='owned_listings', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='price_per_night',
+            field=models.DecimalField(decimal_places=2, help_text='Price per night in local currency', max_digits=10, validators=[django.core.validators.MinValueValidator(0.01)]),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='property_type',
+            field=models.CharField(choices=[('HOUSE', 'House'), ('APARTMENT', 'Apartment'), ('HOTEL', 'Hotel'), ('VILLA', 'Villa'), ('CABIN', 'Cabin'), ('RESORT', 'Resort'), ('BEACH_HOUSE', 'Beach House'), ('TREEHOUSE', 'Treehouse')], help_text='Type of the property', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='title',
+            field=models.CharField(help_text='The title of the property listing', max_length=200),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status'], name='listings_bo_status_8650c6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['check_in', 'check_out'], name='listings_bo_check_i_337c35_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['guest'], name='listings_bo_guest_i_626ae5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['listing', 'status'], name='listings_bo_listing_f09998_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['listing', 'status', 'check_in', 'check_out'], name='booking_avail_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.CheckConstraint(condition=models.Q(('check_out__gt', models.F('check_in'))), name='check_out_after_check_in', violation_error_message='Check-out date must be after check-in date'),
+        ),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.CheckConstraint(condition=models.Q(('guests__gt', 0)), name='at_least_one_guest', violation_error_message='Number of guests must be at least 1'),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='listing',
+            field=models.ForeignKey(help_text='The listing being reviewed', on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='listings.listing'),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='user',
+            field=models.ForeignKey(help_text='User who wrote the review', on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['listing', 'created_at'], name='listings_re_listing_e2bc39_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['user'], name='listings_re_user_id_dfd108_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['rating'], name='listings_re_rating_d53460_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['is_public'], name='listings_re_is_publ_e7f451_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='review',
+            unique_together={('listing', 'user')},
+        ),
+    ]
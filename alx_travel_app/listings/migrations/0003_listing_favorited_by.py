@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-28 05:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0002_review_booking_cancellation_reason_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='listing',
+            name='favorited_by',
+            field=models.ManyToManyField(blank=True, help_text='Users who have favorited this listing', related_name='favorite_listings', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
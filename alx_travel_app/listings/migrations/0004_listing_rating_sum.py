@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-28 05:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0003_listing_favorited_by'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='listing',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Sum of all public review ratings (denormalized)'),
+        ),
+    ]
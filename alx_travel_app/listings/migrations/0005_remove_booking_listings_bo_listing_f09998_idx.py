@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-28 05:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0004_listing_rating_sum'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='listings_bo_listing_f09998_idx',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-28 05:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0005_remove_booking_listings_bo_listing_f09998_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='check_in',
+            field=models.DateField(help_text='Check-in date'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='check_out',
+            field=models.DateField(help_text='Check-out date'),
+        ),
+    ]
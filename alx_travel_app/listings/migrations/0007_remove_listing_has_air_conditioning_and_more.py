@@ -0,0 +1,85 @@
+# Generated by Django 5.2.17 on 2026-08-28 05:59
+
+from django.db import migrations, models
+from django.db.models import F
+
+# Bit positions must match the AMENITY_* constants on Listing.
+AMENITY_MASKS = [
+    ('has_wifi', 1 << 0),
+    ('has_parking', 1 << 1),
+    ('has_kitchen', 1 << 2),
+    ('has_air_conditioning', 1 << 3),
+    ('has_heating', 1 << 4),
+    ('has_tv', 1 << 5),
+    ('has_washer', 1 << 6),
+    ('has_pool', 1 << 7),
+    ('pet_friendly', 1 << 8),
+]
+
+
+def pack_amenities(apps, schema_editor):
+    Listing = apps.get_model('listings', 'Listing')
+    for field, mask in AMENITY_MASKS:
+        Listing.objects.filter(**{field: True}).update(
+            amenities_bits=F('amenities_bits').bitor(mask)
+        )
+
+
+def unpack_amenities(apps, schema_editor):
+    Listing = apps.get_model('listings', 'Listing')
+    for field, mask in AMENITY_MASKS:
+        Listing.objects.annotate(
+            flag=F('amenities_bits').bitand(mask)
+        ).filter(flag=mask).update(**{field: True})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0006_alter_booking_check_in_alter_booking_check_out'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='listing',
+            name='amenities_bits',
+            field=models.BigIntegerField(db_index=True, default=0, help_text='Bit-packed amenity flags (see AMENITY_* constants)'),
+        ),
+        migrations.RunPython(pack_amenities, unpack_amenities),
+        migrations.RemoveField(
+            model_name='listing',
+            name='has_air_conditioning',
+        ),
+        migrations.RemoveField(
+            model_name='listing',
+            name='has_heating',
+        ),
+        migrations.RemoveField(
+            model_name='listing',
+            name='has_kitchen',
+        ),
+        migrations.RemoveField(
+            model_name='listing',
+            name='has_parking',
+        ),
+        migrations.RemoveField(
+            model_name='listing',
+            name='has_pool',
+        ),
+        migrations.RemoveField(
+            model_name='listing',
+            name='has_tv',
+        ),
+        migrations.RemoveField(
+            model_name='listing',
+            name='has_washer',
+        ),
+        migrations.RemoveField(
+            model_name='listing',
+            name='has_wifi',
+        ),
+        migrations.RemoveField(
+            model_name='listing',
+            name='pet_friendly',
+        ),
+    ]
@@ -14,6 +14,19 @@ def validate_check_out_after_check_in(booking):
     if booking.check_out <= booking.check_in:
         raise ValidationError("Check-out date must be after check-in date")
 
+def _amenity_flag(mask):
+    """Expose one bit of Listing.amenities_bits as a writable boolean."""
+    def getter(self):
+        return bool(self.amenities_bits & mask)
+
+    def setter(self, value):
+        if value:
+            self.amenities_bits |= mask
+        else:
+            self.amenities_bits &= ~mask
+
+    return property(getter, setter)
+
 class Listing(models.Model):
     PROPERTY_TYPES = [
         ('HOUSE', 'House'),
@@ -63,24 +76,53 @@ class Listing(models.Model):
         help_text="Whether the property is available for booking"
     )
     owner = models.ForeignKey(
-        User, 
-        on_delete=models.CASCADE, 
+        User,
+        on_delete=models.CASCADE,
         related_name='owned_listings',
         help_text="User who owns this listing"
     )
+    favorited_by = models.ManyToManyField(
+        User,
+        related_name='favorite_listings',
+        blank=True,
+        help_text="Users who have favorited this listing"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
-    # Additional fields for better search and filtering
-    has_wifi = models.BooleanField(default=False)
-    has_parking = models.BooleanField(default=False)
-    has_kitchen = models.BooleanField(default=False)
-    has_air_conditioning = models.BooleanField(default=False)
-    has_heating = models.BooleanField(default=False)
-    has_tv = models.BooleanField(default=False)
-    has_washer = models.BooleanField(default=False)
-    has_pool = models.BooleanField(default=False)
-    pet_friendly = models.BooleanField(default=False)
+    # Amenity flags packed into one integer column: a single byte-sized
+    # value on the row instead of nine boolean columns, and amenity
+    # searches become one bitwise predicate instead of nine AND clauses:
+    # .annotate(m=F('amenities_bits').bitand(MASK)).filter(m=MASK)
+    AMENITY_WIFI = 1 << 0
+    AMENITY_PARKING = 1 << 1
+    AMENITY_KITCHEN = 1 << 2
+    AMENITY_AIR_CONDITIONING = 1 << 3
+    AMENITY_HEATING = 1 << 4
+    AMENITY_TV = 1 << 5
+    AMENITY_WASHER = 1 << 6
+    AMENITY_POOL = 1 << 7
+    AMENITY_PET_FRIENDLY = 1 << 8
+
+    amenities_bits = models.BigIntegerField(
+        default=0,
+        db_index=True,
+        help_text="Bit-packed amenity flags (see AMENITY_* constants)"
+    )
+
+    # Writable boolean accessors keep the public shape of the old columns:
+    # serializers still render/accept has_wifi etc., and Listing(**kwargs)
+    # construction (e.g. the seeder) keeps working, since Model.__init__
+    # accepts settable properties as keyword arguments.
+    has_wifi = _amenity_flag(AMENITY_WIFI)
+    has_parking = _amenity_flag(AMENITY_PARKING)
+    has_kitchen = _amenity_flag(AMENITY_KITCHEN)
+    has_air_conditioning = _amenity_flag(AMENITY_AIR_CONDITIONING)
+    has_heating = _amenity_flag(AMENITY_HEATING)
+    has_tv = _amenity_flag(AMENITY_TV)
+    has_washer = _amenity_flag(AMENITY_WASHER)
+    has_pool = _amenity_flag(AMENITY_POOL)
+    pet_friendly = _amenity_flag(AMENITY_PET_FRIENDLY)
     
     # Location details
     latitude = models.DecimalField(
@@ -125,12 +167,15 @@ class Booking(models.Model):
         related_name='bookings',
         help_text="User who made the booking"
     )
+    # No future-date validators here: BookingSerializer.validate rejects
+    # past check-ins with a user-facing message, and a DB CHECK can't
+    # reference NOW() portably (MySQL forbids non-deterministic functions
+    # in CHECK constraints). Keeping the validator off the fields also
+    # spares a timezone.now() call per field on bulk loads.
     check_in = models.DateField(
-        validators=[validate_future_date],
         help_text="Check-in date"
     )
     check_out = models.DateField(
-        validators=[validate_future_date],
         help_text="Check-out date"
     )
     guests = models.PositiveIntegerField(
@@ -167,31 +212,22 @@ class Booking(models.Model):
         if self.check_in and self.check_out:
             if self.check_out <= self.check_in:
                 raise ValidationError("Check-out date must be after check-in date")
-            
-            # Check for overlapping bookings
-            overlapping = Booking.objects.filter(
-                listing=self.listing,
-                check_out__gt=self.check_in,
-                check_in__lt=self.check_out,
-                status__in=['PENDING', 'CONFIRMED']
-            ).exclude(pk=self.pk if self.pk else None)
-            
-            if overlapping.exists():
-                raise ValidationError("This property is already booked for the selected dates.")
-            
+
+            # The overlap check lives in BookingSerializer, which performs it
+            # under a listing row lock so concurrent requests can't
+            # double-book. Re-running it here would add a second SELECT to
+            # every save without closing that race.
+
             # Validate number of guests doesn't exceed listing capacity
             if self.guests > self.listing.max_guests:
                 raise ValidationError(
                     f"Number of guests ({self.guests}) exceeds the maximum allowed ({self.listing.max_guests})"
                 )
 
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        # Calculate total price if not set
-        if not self.total_price and self.check_in and self.check_out and self.listing:
-            nights = (self.check_out - self.check_in).days
-            self.total_price = self.listing.price_per_night * nights
-        super().save(*args, **kwargs)
+    # No save() override: validation happens once at the API boundary
+    # (BookingSerializer), with the Meta CheckConstraints as the backstop,
+    # and the serializer computes total_price eagerly. Non-API writers
+    # (shell, management commands) should call full_clean() themselves.
 
     class Meta:
         ordering = ['-created_at']
@@ -212,7 +248,13 @@ class Booking(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['check_in', 'check_out']),
             models.Index(fields=['guest']),
-            models.Index(fields=['listing', 'status']),
+            # Backs the overlap/availability check, which filters on all four.
+            # A (listing, status) index would be a pure prefix of this one,
+            # so it is omitted to save write amplification.
+            models.Index(
+                fields=['listing', 'status', 'check_in', 'check_out'],
+                name='booking_avail_idx'
+            ),
         ]
 
 
@@ -302,59 +344,132 @@ class Review(models.Model):
     
     def clean(self):
         super().clean()
-        
-        # Ensure the user has actually booked the property to leave a review
-        if not Booking.objects.filter(
-            listing=self.listing,
-            guest=self.user,
-            status='COMPLETED',
-            check_out__lte=timezone.now().date()
-        ).exists():
-            raise ValidationError("You can only review properties you've actually stayed at.")
-        
+
+        # The completed-stay requirement is enforced once, at the API
+        # boundary (ReviewCreateSerializer.validate), and one-review-per-
+        # user by the unique_together constraint — re-querying bookings on
+        # every model save (including bulk loads) only added a round-trip.
+
         # Validate stay date is not in the future
         if self.stay_date and self.stay_date > timezone.now().date():
             raise ValidationError("Stay date cannot be in the future.")
     
     def save(self, *args, **kwargs):
         self.full_clean()
+
+        # Capture the previous public contribution so the listing's
+        # denormalized rating can be adjusted incrementally (O(1) UPDATE)
+        # instead of re-aggregating every review
+        old = None
+        if self.pk:
+            old = Review.objects.filter(pk=self.pk).values_list(
+                'rating', 'is_public'
+            ).first()
+
         super().save(*args, **kwargs)
-        
-        # Update the listing's average rating
-        self.listing.update_average_rating()
-    
+
+        old_sum, old_count = (old[0], 1) if old and old[1] else (0, 0)
+        new_sum, new_count = (self.rating, 1) if self.is_public else (0, 0)
+        rating_delta = new_sum - old_sum
+        count_delta = new_count - old_count
+        if rating_delta or count_delta:
+            self.listing.apply_rating_delta(rating_delta, count_delta)
+
     def delete(self, *args, **kwargs):
         listing = self.listing
+        rating = self.rating
+        was_public = self.is_public
         super().delete(*args, **kwargs)
-        # Update the listing's average rating after deletion
-        listing.update_average_rating()
+        # Subtract this review's contribution after deletion
+        if was_public:
+            listing.apply_rating_delta(-rating, -1)
 
 # Add the update_average_rating method to the Listing model
 def update_average_rating(self):
     """
-    Update the average rating for the listing based on all its reviews.
+    Recompute the denormalized rating fields from scratch.
+
+    The per-review write path uses apply_rating_delta instead; this full
+    recompute remains for bulk loads (e.g. seeding) and manual resyncs.
     """
-    from django.db.models import Avg, Count
-    
+    from django.db.models import Avg, Count, Sum
+
     result = Review.objects.filter(
         listing=self,
         is_public=True
     ).aggregate(
         average_rating=Avg('rating'),
+        rating_sum=Sum('rating'),
         review_count=Count('id')
     )
-    
+
     self.average_rating = result['average_rating'] or 0
+    self.rating_sum = result['rating_sum'] or 0
     self.review_count = result['review_count']
-    
+
     # Save without triggering signals to avoid infinite loops
     Listing.objects.filter(pk=self.pk).update(
         average_rating=self.average_rating,
+        rating_sum=self.rating_sum,
         review_count=self.review_count
     )
 
-# Add the method to the Listing model
+def apply_rating_delta(self, rating_delta, count_delta):
+    """
+    Fold one review change into the denormalized rating fields.
+
+    Uses F-expressions so the adjustment is an atomic O(1) UPDATE rather
+    than an aggregate scan over all of the listing's reviews.
+    """
+    from django.db.models import Case, DecimalField, ExpressionWrapper, F, Value, When
+
+    Listing.objects.filter(pk=self.pk).update(
+        rating_sum=F('rating_sum') + rating_delta,
+        review_count=F('review_count') + count_delta,
+    )
+    Listing.objects.filter(pk=self.pk).update(
+        average_rating=Case(
+            When(review_count=0, then=Value(0)),
+            default=ExpressionWrapper(
+                F('rating_sum') * 1.0 / F('review_count'),
+                output_field=DecimalField(max_digits=3, decimal_places=2),
+            ),
+            output_field=DecimalField(max_digits=3, decimal_places=2),
+        )
+    )
+
+def bulk_update_ratings(cls, listing_ids):
+    """
+    Recompute the denormalized rating fields for many listings at once.
+
+    Issues a single correlated UPDATE instead of one aggregate + UPDATE
+    per listing, which is what the batch paths (seeding, imports) want.
+    """
+    from django.db.models import Avg, Count, OuterRef, Subquery, Sum, Value
+    from django.db.models.functions import Coalesce, Round
+
+    public = Review.objects.filter(
+        listing=OuterRef('pk'),
+        is_public=True
+    ).order_by().values('listing')
+
+    cls.objects.filter(pk__in=listing_ids).update(
+        rating_sum=Coalesce(
+            Subquery(public.annotate(s=Sum('rating')).values('s')), Value(0)
+        ),
+        review_count=Coalesce(
+            Subquery(public.annotate(c=Count('pk')).values('c')), Value(0)
+        ),
+        average_rating=Coalesce(
+            Subquery(public.annotate(a=Round(Avg('rating'), 2)).values('a')),
+            Value(0),
+        ),
+    )
+
+# Add the methods to the Listing model
 Listing.update_average_rating = update_average_rating
+Listing.apply_rating_delta = apply_rating_delta
+Listing.bulk_update_ratings = classmethod(bulk_update_ratings)
 
 # Add the average_rating and review_count fields to the Listing model
 Listing.add_to_class('average_rating', models.DecimalField(
@@ -370,3 +485,9 @@ Listing.add_to_class('review_count', models.PositiveIntegerField(
     editable=False,
     help_text="Total number of reviews for this listing"
 ))
+
+Listing.add_to_class('rating_sum', models.PositiveIntegerField(
+    default=0,
+    editable=False,
+    help_text="Sum of all public review ratings (denormalized)"
+))
@@ -1,26 +1,62 @@
+from copy import copy
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Prefetch, Q
 from django.utils import timezone
 from datetime import timedelta
 from .models import Listing, Booking, Review
+from .signals import listing_meta
 
 User = get_user_model()
 
-class UserBasicSerializer(serializers.ModelSerializer):
+def to_plain(data):
+    """
+    Recursively convert serializer output (ReturnDict/ReturnList and the
+    OrderedDicts DRF nests inside them) into plain dicts and lists.
+
+    Plain containers pickle noticeably faster, so cache any serializer
+    payload through this helper before storing it.
+    """
+    if isinstance(data, dict):
+        return {key: to_plain(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [to_plain(item) for item in data]
+    return data
+
+class CachedFieldsSerializerMixin:
+    """
+    Cache get_fields() per serializer class and hand out shallow copies.
+
+    DRF deep-copies every declared field each time a serializer is
+    instantiated, which shows up as the dominant cost when serializing
+    lists. The field templates are built once per class; each instance
+    gets shallow copies, which are re-bound on use as normal.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = self.__class__
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {name: copy(field) for name, field in self._fields_cache[cls].items()}
+
+class UserBasicSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Basic user serializer with minimal information."""
     class Meta:
         model = User
         fields = ('id', 'username', 'first_name', 'last_name', 'email')
         read_only_fields = ('id', 'email')
 
-class UserPublicSerializer(serializers.ModelSerializer):
+class UserPublicSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Public user profile serializer."""
     class Meta:
         model = User
         fields = ('id', 'username', 'first_name', 'last_name', 'date_joined')
         read_only_fields = fields
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for the Review model."""
     user = UserPublicSerializer(read_only=True)
     can_edit = serializers.SerializerMethodField()
@@ -83,18 +119,29 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
         
         return data
 
-class ListingBasicSerializer(serializers.ModelSerializer):
+class ListingBasicSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Basic listing serializer with essential fields."""
     class Meta:
         model = Listing
-        fields = [
+        fields = (
             'id', 'title', 'city', 'country', 'price_per_night',
             'bedrooms', 'bathrooms', 'max_guests', 'property_type',
-            'average_rating', 'review_count', 'thumbnail'
-        ]
+            'average_rating', 'review_count'
+        )
         read_only_fields = fields
 
-class ListingSerializer(serializers.ModelSerializer):
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Restrict the SELECT to the rendered columns.
+
+        The list endpoint doesn't need description, amenities or the
+        coordinate decimals, and skipping them shrinks each row several
+        times over.
+        """
+        return queryset.only(*cls.Meta.fields)
+
+class ListingSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for the Listing model."""
     owner = UserPublicSerializer(read_only=True)
     is_available = serializers.BooleanField(read_only=True)
@@ -104,64 +151,169 @@ class ListingSerializer(serializers.ModelSerializer):
         read_only=True
     )
     review_count = serializers.IntegerField(read_only=True)
-    
+    # The amenity flags are model properties backed by amenities_bits, so
+    # they're declared explicitly to stay writable through the API.
+    has_wifi = serializers.BooleanField(required=False)
+    has_parking = serializers.BooleanField(required=False)
+    has_kitchen = serializers.BooleanField(required=False)
+    has_air_conditioning = serializers.BooleanField(required=False)
+    has_heating = serializers.BooleanField(required=False)
+    has_tv = serializers.BooleanField(required=False)
+    has_washer = serializers.BooleanField(required=False)
+    has_pool = serializers.BooleanField(required=False)
+    pet_friendly = serializers.BooleanField(required=False)
+
     class Meta:
         model = Listing
-        fields = [
+        fields = (
             'id', 'title', 'description', 'address', 'city', 'country',
             'price_per_night', 'bedrooms', 'bathrooms', 'max_guests',
             'property_type', 'amenities', 'is_available', 'owner',
-            'average_rating', 'review_count', 'thumbnail',
+            'average_rating', 'review_count',
             'has_wifi', 'has_parking', 'has_kitchen', 'has_air_conditioning',
             'has_heating', 'has_tv', 'has_washer', 'has_pool', 'pet_friendly',
             'latitude', 'longitude', 'created_at', 'updated_at'
-        ]
+        )
         read_only_fields = ('id', 'created_at', 'updated_at', 'owner')
-    
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Fetch the relations this serializer renders to avoid N+1 queries."""
+        return queryset.select_related('owner')
+
     def validate_price_per_night(self, value):
         """Validate that price is positive."""
         if value <= 0:
             raise serializers.ValidationError("Price per night must be greater than 0")
         return value
 
+class NestedBookingSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Lean booking representation for nesting inside listing payloads.
+
+    Deliberately omits the guest and listing relations so rendering a
+    listing's bookings doesn't pull (or serialize) a user per booking.
+    """
+    class Meta:
+        model = Booking
+        fields = ('id', 'check_in', 'check_out', 'status')
+        read_only_fields = fields
+
 class ListingDetailSerializer(ListingSerializer):
-    """Detailed listing serializer with related data."""
+    """
+    Detailed listing serializer with related data.
+
+    Bookings are deliberately not embedded: a popular listing can carry
+    thousands, so they're served paginated from /listings/{id}/bookings/.
+    """
     reviews = serializers.SerializerMethodField()
     is_favorite = serializers.SerializerMethodField()
-    
+
     class Meta(ListingSerializer.Meta):
-        fields = ListingSerializer.Meta.fields + ['reviews', 'is_favorite']
-    
+        fields = ListingSerializer.Meta.fields + ('reviews', 'is_favorite')
+
+    REVIEWS_PAGE_SIZE = 10
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Additionally prefetch the relations rendered on detail.
+
+        The reviews prefetch is sliced to the first page — a heavily
+        reviewed listing shouldn't materialize thousands of review (and
+        user) instances to render ten — with the total carried by a
+        Count annotation instead of len() over the full relation.
+        """
+        queryset = super().setup_eager_loading(queryset)
+        return queryset.annotate(
+            public_review_count=Count(
+                'reviews', filter=Q(reviews__is_public=True)
+            )
+        ).prefetch_related(
+            Prefetch(
+                'reviews',
+                queryset=Review.objects.filter(is_public=True)
+                                       .select_related('user')
+                                       .order_by('-created_at')
+                                       [:cls.REVIEWS_PAGE_SIZE],
+                to_attr='public_reviews',
+            ),
+        )
+
     def get_reviews(self, obj):
-        """Get paginated reviews for the listing."""
-        from rest_framework.pagination import PageNumberPagination
-        from rest_framework.request import Request
-        
-        reviews = obj.reviews.filter(is_public=True).order_by('-created_at')
-        
-        # Check if we're in a request context with pagination
-        if isinstance(self.context.get('request'), Request):
-            paginator = PageNumberPagination()
-            paginated_reviews = paginator.paginate_queryset(reviews, self.context['request'])
-            serializer = ReviewSerializer(paginated_reviews, many=True, context=self.context)
-            return paginator.get_paginated_response(serializer.data).data
-        
-        # Return all reviews if not in a request context
-        return ReviewSerializer(reviews, many=True, context=self.context).data
+        """
+        A page of public reviews.
+
+        Page one — the overwhelmingly common case — comes straight from
+        the prefetched window and the annotated count, with no queries
+        during serialization. Deeper pages fall back to a windowed
+        LIMIT/OFFSET query.
+        """
+        page = 1
+        request = self.context.get('request')
+        if request is not None:
+            try:
+                page = max(int(request.query_params.get('page', 1)), 1)
+            except (TypeError, ValueError):
+                page = 1
+
+        size = self.REVIEWS_PAGE_SIZE
+        count = getattr(obj, 'public_review_count', None)
+        if count is None:
+            # Serialized outside the viewset's annotated queryset.
+            count = obj.reviews.filter(is_public=True).order_by().count()
+
+        window = getattr(obj, 'public_reviews', None) if page == 1 else None
+        if window is None:
+            window = obj.reviews.filter(is_public=True) \
+                                .select_related('user') \
+                                .order_by('-created_at') \
+                                [(page - 1) * size:page * size]
+
+        return {
+            'count': count,
+            'results': ReviewSerializer(window, many=True, context=self.context).data,
+        }
     
     def get_is_favorite(self, obj):
-        """Check if the current user has favorited this listing."""
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.favorited_by.filter(pk=request.user.pk).exists()
-        return False
+        """
+        Check if the current user has favorited this listing.
+
+        The view batches the user's favorite ids into the context with a
+        single query, so per-object rendering is a set lookup rather than
+        an exists() query per listing.
+        """
+        return obj.id in self.context.get('favorited_ids', ())
+
+class ListingStubRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolve a listing pk without fetching the listing row.
+
+    The booking write path only ever reads listing.pk — price, capacity
+    and availability all come from the cached listing_meta — so a full
+    PrimaryKeyRelatedField lookup would hydrate ~30 columns for nothing.
+    Existence is checked against the meta cache instead, and the value
+    is a Listing stub carrying just the pk.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', Listing.objects.only('pk'))
+        super().__init__(**kwargs)
 
-class BookingSerializer(serializers.ModelSerializer):
+    def to_internal_value(self, data):
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if listing_meta(pk) is None:
+            self.fail('does_not_exist', pk_value=pk)
+        return Listing(pk=pk)
+
+class BookingSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for the Booking model."""
     guest = UserPublicSerializer(read_only=True)
     listing = ListingBasicSerializer(read_only=True)
-    listing_id = serializers.PrimaryKeyRelatedField(
-        queryset=Listing.objects.all(),
+    listing_id = ListingStubRelatedField(
         source='listing',
         write_only=True
     )
@@ -174,11 +326,11 @@ class BookingSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Booking
-        fields = [
+        fields = (
             'id', 'listing', 'listing_id', 'guest', 'check_in', 'check_out',
             'guests', 'total_price', 'status', 'special_requests',
             'cancelled_at', 'cancellation_reason', 'created_at', 'updated_at'
-        ]
+        )
         read_only_fields = (
             'id', 'guest', 'status', 'total_price', 'cancelled_at',
             'cancellation_reason', 'created_at', 'updated_at'
@@ -218,34 +370,26 @@ class BookingSerializer(serializers.ModelSerializer):
                     'check_out': 'Maximum stay is 30 nights.'
                 })
             
-            # Check listing availability
-            if listing and not listing.is_available:
+            # Check listing availability via the cached meta so validation
+            # doesn't depend on a full listing row being fetched
+            if listing and not listing_meta(listing.pk)['is_available']:
                 raise serializers.ValidationError({
                     'listing': 'This listing is not available for booking.'
                 })
             
-            # Check for overlapping bookings
-            overlapping_bookings = Booking.objects.filter(
-                listing=listing,
-                check_out__gt=check_in,
-                check_in__lt=check_out,
-                status__in=['PENDING', 'CONFIRMED']
-            )
-            
-            if self.instance:
-                overlapping_bookings = overlapping_bookings.exclude(pk=self.instance.pk)
-                
-            if overlapping_bookings.exists():
+            # No overlap check here: create() and update() both perform it
+            # under a listing row lock so two concurrent requests can't
+            # both pass it (MySQL has no exclusion constraints to enforce
+            # non-overlap at the schema level).
+
+        # Validate number of guests
+        if listing:
+            max_guests = listing_meta(listing.pk)['max_guests']
+            if guests > max_guests:
                 raise serializers.ValidationError({
-                    'check_in': 'This listing is not available for the selected dates.'
+                    'guests': f'Maximum {max_guests} guests allowed for this listing.'
                 })
         
-        # Validate number of guests
-        if listing and guests > listing.max_guests:
-            raise serializers.ValidationError({
-                'guests': f'Maximum {listing.max_guests} guests allowed for this listing.'
-            })
-        
         return data
     
     def create(self, validated_data):
@@ -253,22 +397,85 @@ class BookingSerializer(serializers.ModelSerializer):
         listing = validated_data['listing']
         check_in = validated_data['check_in']
         check_out = validated_data['check_out']
-        
-        # Calculate total price
+
+        # Calculate total price from the cached listing meta
         nights = (check_out - check_in).days
-        total_price = listing.price_per_night * nights
-        
+        total_price = listing_meta(listing.pk)['price_per_night'] * nights
+
         # Add additional charges if needed (e.g., cleaning fee, taxes)
         # total_price += Decimal('50.00')  # Example: Add cleaning fee
-        
-        # Create the booking
-        booking = Booking.objects.create(
-            **validated_data,
-            guest=self.context['request'].user,
-            total_price=total_price,
-            status='PENDING'  # Or 'CONFIRMED' based on your business logic
-        )
-        
+
+        # The view's perform_create already merges the guest into
+        # validated_data via save(guest=...), so don't pass it twice.
+        guest = validated_data.pop('guest', self.context['request'].user)
+
+        with transaction.atomic():
+            # Lock the listing row so concurrent booking attempts for the
+            # same listing serialize here, then run the overlap check while
+            # holding the lock — the MySQL-compatible stand-in for a
+            # Postgres GiST EXCLUDE constraint
+            Listing.objects.select_for_update().only('id').get(pk=listing.pk)
+
+            # order_by() strips Meta.ordering so the EXISTS probe compiles
+            # without a pointless sort and can stay on the covering index.
+            overlapping = Booking.objects.order_by().filter(
+                listing=listing,
+                check_out__gt=check_in,
+                check_in__lt=check_out,
+                status__in=['PENDING', 'CONFIRMED']
+            ).values('pk')
+            if overlapping.exists():
+                raise serializers.ValidationError({
+                    'check_in': 'This listing is not available for the selected dates.'
+                })
+
+            booking = Booking.objects.create(
+                **validated_data,
+                guest=guest,
+                total_price=total_price,
+                status='PENDING'  # Or 'CONFIRMED' based on your business logic
+            )
+
+        # The listing on the new booking is a pk-only stub; swap in the
+        # narrow column set the nested serializer renders.
+        booking.listing = Listing.objects.only(
+            *ListingBasicSerializer.Meta.fields
+        ).get(pk=listing.pk)
+        return booking
+
+    def update(self, instance, validated_data):
+        """Apply updates with moved dates re-checked under the row lock."""
+        listing = validated_data.get('listing')
+        listing_id = listing.pk if listing else instance.listing_id
+        check_in = validated_data.get('check_in', instance.check_in)
+        check_out = validated_data.get('check_out', instance.check_out)
+
+        with transaction.atomic():
+            # Same lock as create(): serialize against concurrent writes
+            # for this listing before re-checking the (possibly moved)
+            # date range for overlap.
+            Listing.objects.select_for_update().only('id').get(pk=listing_id)
+
+            overlapping = Booking.objects.order_by().filter(
+                listing_id=listing_id,
+                check_out__gt=check_in,
+                check_in__lt=check_out,
+                status__in=['PENDING', 'CONFIRMED']
+            ).values('pk').exclude(pk=instance.pk)
+            if overlapping.exists():
+                raise serializers.ValidationError({
+                    'check_in': 'This listing is not available for the selected dates.'
+                })
+
+            booking = super().update(instance, validated_data)
+
+        if listing is not None:
+            # A reassigned listing arrives as a pk-only stub; swap in the
+            # narrow column set the nested serializer renders, as create()
+            # does, so the response isn't a hollow listing body.
+            booking.listing = Listing.objects.only(
+                *ListingBasicSerializer.Meta.fields
+            ).get(pk=listing_id)
         return booking
 
 class BookingDetailSerializer(BookingSerializer):
@@ -277,20 +484,25 @@ class BookingDetailSerializer(BookingSerializer):
     has_reviewed = serializers.SerializerMethodField()
     
     class Meta(BookingSerializer.Meta):
-        fields = BookingSerializer.Meta.fields + ['can_review', 'has_reviewed']
+        fields = BookingSerializer.Meta.fields + ('can_review', 'has_reviewed')
     
     def get_can_review(self, obj):
         """Check if the booking can be reviewed."""
         if not obj.status == 'COMPLETED':
             return False
-            
-        if not hasattr(obj, 'has_reviewed'):
-            obj.has_reviewed = obj.reviews.exists()
-            
-        return not obj.has_reviewed
-    
+        return not self.get_has_reviewed(obj)
+
     def get_has_reviewed(self, obj):
-        """Check if the booking has been reviewed."""
-        if not hasattr(obj, 'has_reviewed'):
-            obj.has_reviewed = obj.reviews.exists()
-        return obj.has_reviewed
+        """
+        Check if the guest has reviewed the booked listing.
+
+        BookingViewSet annotates has_reviewed with an Exists() subquery,
+        so rendering reads the annotation instead of querying per row.
+        """
+        has_reviewed = getattr(obj, 'has_reviewed', None)
+        if has_reviewed is None:
+            # Serialized outside the viewset's annotated queryset.
+            has_reviewed = Review.objects.order_by().filter(
+                listing_id=obj.listing_id, user_id=obj.guest_id
+            ).values('pk').exists()
+        return has_reviewed
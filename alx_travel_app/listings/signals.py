@@ -0,0 +1,64 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Booking, Listing
+
+AVAILABILITY_VERSION_KEY = 'avail:ver:{listing_id}'
+LISTING_META_KEY = 'listing:meta:{listing_id}'
+LISTING_META_TIMEOUT = 600
+
+
+def availability_version(listing_id):
+    """Current cache version for a listing's availability entries."""
+    return cache.get(AVAILABILITY_VERSION_KEY.format(listing_id=listing_id), 0)
+
+
+def bump_availability_version(listing_id):
+    """
+    Invalidate cached availability checks for a listing.
+
+    Bumping a per-listing version number leaves the stale entries to lapse
+    via their TTL, which works on any cache backend (no delete_pattern
+    support required).
+    """
+    key = AVAILABILITY_VERSION_KEY.format(listing_id=listing_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def listing_meta(listing_id):
+    """
+    The small, hot subset of Listing columns that booking validation
+    needs, served from cache.
+
+    Keeps availability checks and booking writes from fetching the full
+    ~30-column listing row (description text, amenities JSON, ...) when
+    all they read is price, capacity and the availability flag. Returns
+    None for an unknown listing id.
+    """
+    key = LISTING_META_KEY.format(listing_id=listing_id)
+    meta = cache.get(key)
+    if meta is None:
+        meta = Listing.objects.filter(pk=listing_id).values(
+            'id', 'price_per_night', 'max_guests', 'is_available', 'owner_id'
+        ).first()
+        if meta is not None:
+            cache.set(key, meta, LISTING_META_TIMEOUT)
+    return meta
+
+
+@receiver(post_save, sender=Booking)
+@receiver(post_delete, sender=Booking)
+def invalidate_availability_cache(sender, instance, **kwargs):
+    """Booking writes change availability, so drop the cached answers."""
+    bump_availability_version(instance.listing_id)
+
+
+@receiver(post_save, sender=Listing)
+@receiver(post_delete, sender=Listing)
+def invalidate_listing_meta(sender, instance, **kwargs):
+    """Listing writes may change price/capacity, so drop the cached meta."""
+    cache.delete(LISTING_META_KEY.format(listing_id=instance.pk))
@@ -1,10 +1,23 @@
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
-from .models import Listing, Booking
-from .serializers import ListingSerializer, BookingSerializer, ListingDetailSerializer
+from django.utils.http import http_date, parse_http_date_safe
+from datetime import date
+from .models import Listing, Booking, Review
+from .signals import availability_version, bump_availability_version
+from .serializers import (
+    ListingBasicSerializer,
+    ListingSerializer,
+    BookingSerializer,
+    BookingDetailSerializer,
+    ListingDetailSerializer,
+    NestedBookingSerializer,
+    to_plain,
+)
 
 class ListingViewSet(viewsets.ModelViewSet):
     """
@@ -17,11 +30,118 @@ class ListingViewSet(viewsets.ModelViewSet):
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return ListingDetailSerializer
+        if self.action == 'list':
+            return ListingBasicSerializer
         return ListingSerializer
 
+    def get_queryset(self):
+        """
+        Let the active serializer declare its eager loading so list and
+        detail responses don't trigger per-row queries.
+        """
+        return self.get_serializer_class().setup_eager_loading(Listing.objects.all())
+
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
+    def get_serializer_context(self):
+        """
+        Add the user's favorite listing ids for is_favorite rendering.
+
+        One batched query instead of an exists() probe per serialized
+        listing — and only for retrieve, the one action whose serializer
+        renders is_favorite; the list serializer doesn't, so the hot list
+        path shouldn't pay for the query.
+        """
+        context = super().get_serializer_context()
+        user = self.request.user
+        if self.action == 'retrieve' and user.is_authenticated:
+            context['favorited_ids'] = set(
+                user.favorite_listings.values_list('id', flat=True)
+            )
+        return context
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serve the detail payload from cache when possible.
+
+        The rendered body is expensive (nested owner, reviews with their
+        users), so it's cached keyed by the listing's updated_at — writes
+        bump the timestamp via auto_now, which rolls the key and
+        invalidates stale entries for free. The blob is shared across
+        users; the per-user bits — is_favorite and each review's
+        can_edit — are patched onto it afterwards.
+        """
+        pk = kwargs.get(self.lookup_field)
+        version = Listing.objects.filter(pk=pk).values_list(
+            'updated_at', flat=True
+        ).first()
+        if version is None:
+            # Let the standard machinery produce the 404.
+            return super().retrieve(request, *args, **kwargs)
+
+        # Conditional-request fast path: updated_at doubles as a weak
+        # validator, so a client re-checking an unchanged listing gets a
+        # bodiless 304 before any cache read or serialization happens.
+        etag = f'W/"{int(version.timestamp())}"'
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            if if_none_match == etag:
+                return Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            if_modified_since = parse_http_date_safe(
+                request.headers.get('If-Modified-Since', '')
+            )
+            if (
+                if_modified_since is not None
+                and int(version.timestamp()) <= if_modified_since
+            ):
+                return Response(status=status.HTTP_304_NOT_MODIFIED)
+
+        # Reviews inside the payload are paginated from the query string,
+        # so the page has to be part of the key — normalized the same way
+        # the serializer reads it, so junk values can't mint extra entries.
+        try:
+            page = max(int(request.query_params.get('page', 1)), 1)
+        except (TypeError, ValueError):
+            page = 1
+        cache_key = f'listing:detail:{pk}:{int(version.timestamp())}:{page}'
+        data = cache.get(cache_key)
+        if data is None:
+            data = to_plain(super().retrieve(request, *args, **kwargs).data)
+            cache.set(cache_key, data, 300)
+
+        data['is_favorite'] = bool(
+            request.user.is_authenticated
+            and Listing.favorited_by.through.objects.filter(
+                listing_id=pk, user_id=request.user.id
+            ).exists()
+        )
+        # can_edit was rendered with whatever user warmed the cache, so
+        # recompute it for this request from the review's author id.
+        user_id = request.user.id if request.user.is_authenticated else None
+        for review in data.get('reviews', {}).get('results', ()):
+            review['can_edit'] = review['user']['id'] == user_id
+        response = Response(data)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(version.timestamp())
+        return response
+
+    @action(detail=True, methods=['get'])
+    def bookings(self, request, pk=None):
+        """
+        Paginated bookings for a listing, most recent check-in first.
+
+        Kept off the detail payload so a listing with thousands of
+        bookings still serves a constant-sized response.
+        """
+        queryset = Booking.objects.filter(listing_id=pk).order_by('-check_in')
+        paginator = PageNumberPagination()
+        paginator.page_size = 20
+        page = paginator.paginate_queryset(queryset, request)
+        serializer = NestedBookingSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
     @action(detail=True, methods=['get'])
     def available(self, request, pk=None):
         """
@@ -39,8 +159,11 @@ class ListingViewSet(viewsets.ModelViewSet):
             )
 
         try:
-            check_in = timezone.datetime.strptime(check_in, '%Y-%m-%d').date()
-            check_out = timezone.datetime.strptime(check_out, '%Y-%m-%d').date()
+            # date.fromisoformat is a C fast-path for YYYY-MM-DD, much
+            # cheaper than strptime's format-string interpreter on this
+            # hot endpoint. It raises the same ValueError on bad input.
+            check_in = date.fromisoformat(check_in)
+            check_out = date.fromisoformat(check_out)
         except ValueError:
             return Response(
                 {"error": "Invalid date format. Use YYYY-MM-DD"},
@@ -53,13 +176,23 @@ class ListingViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Check for overlapping bookings
-        is_available = not Booking.objects.filter(
-            listing=listing,
-            check_out__gt=check_in,
-            check_in__lt=check_out,
-            status__in=['PENDING', 'CONFIRMED']
-        ).exists()
+        # Availability is read-heavy and only changes on booking writes, so
+        # cache the answer briefly. The key embeds a per-listing version that
+        # booking save/delete signals bump, invalidating stale entries.
+        cache_key = (
+            f'avail:{listing.id}:{availability_version(listing.id)}'
+            f':{check_in}:{check_out}'
+        )
+        is_available = cache.get_or_set(
+            cache_key,
+            lambda: not Booking.objects.order_by().filter(
+                listing=listing,
+                check_out__gt=check_in,
+                check_in__lt=check_out,
+                status__in=['PENDING', 'CONFIRMED']
+            ).values('pk').exists(),
+            60,
+        )
 
         return Response({
             'is_available': is_available,
@@ -75,14 +208,35 @@ class BookingViewSet(viewsets.ModelViewSet):
     serializer_class = BookingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_serializer_class(self):
+        if self.action == 'retrieve':
+            return BookingDetailSerializer
+        return BookingSerializer
+
     def get_queryset(self):
         """
         Return bookings for the authenticated user or all bookings for staff.
+
+        The serializer nests listing (with its owner) and guest, so join
+        them here rather than firing two extra SELECTs per booking.
         """
         user = self.request.user
+        queryset = Booking.objects.select_related('listing', 'listing__owner', 'guest')
+        if self.action == 'retrieve':
+            # The detail serializer renders review status; an Exists()
+            # annotation answers it in the same query instead of a
+            # per-object probe during serialization.
+            queryset = queryset.annotate(
+                has_reviewed=Exists(
+                    Review.objects.filter(
+                        listing=OuterRef('listing_id'),
+                        user=OuterRef('guest_id'),
+                    )
+                )
+            )
         if user.is_staff:
-            return Booking.objects.all()
-        return Booking.objects.filter(guest=user)
+            return queryset
+        return queryset.filter(guest=user)
 
     def perform_create(self, serializer):
         """
@@ -116,11 +270,20 @@ class BookingViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        booking.status = 'CANCELLED'
-        booking.save()
-        
+        # A targeted UPDATE: cancelling can't cause an overlap, so there's
+        # nothing for instance save() machinery to validate, and the field
+        # set is known. update() skips signals, so the availability cache
+        # version is bumped by hand.
+        now = timezone.now()
+        Booking.objects.filter(pk=booking.pk).update(
+            status='CANCELLED',
+            cancelled_at=now,
+            updated_at=now,
+        )
+        bump_availability_version(booking.listing_id)
+
         return Response({
             "message": "Booking cancelled successfully",
             "booking_id": booking.id,
-            "status": booking.status
+            "status": "CANCELLED"
         })